@@ -9,8 +9,10 @@ Relationship: Physical = Logical * scale + offset
 Typical Windows DPI scaling: 1.0, 1.25, 1.5, 1.75, 2.0
 """
 
+import copy
 import json
-import statistics
+import os
+from math import floor
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -33,10 +35,12 @@ LANDMARKS = {
 }
 
 
-def load_state() -> dict:
-    """Load persisted calibration state."""
-    if STATE_FILE.exists():
-        return json.loads(STATE_FILE.read_text(encoding="utf-8"))
+# Parsed state keyed on the file's mtime, so conversions skip the disk read
+# and JSON parse until the file actually changes.
+_STATE_CACHE = {"mtime": None, "state": None, "transforms": None}
+
+
+def _default_state() -> dict:
     return {
         "calibrated": False,
         "scale_x": None,
@@ -49,10 +53,98 @@ def load_state() -> dict:
     }
 
 
-def save_state(state: dict) -> None:
-    """Persist calibration state."""
+def _current_state() -> dict:
+    """Return the cached state, re-reading the file only when its mtime changes."""
+    try:
+        mtime = STATE_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        _STATE_CACHE.update(mtime=None, state=None, transforms=None)
+        return _default_state()
+    if mtime != _STATE_CACHE["mtime"]:
+        state = json.loads(STATE_FILE.read_text(encoding="utf-8"))
+        _STATE_CACHE.update(mtime=mtime, state=state, transforms=None)
+    return _STATE_CACHE["state"]
+
+
+def _transforms() -> tuple[tuple[float, float, float, float], tuple[float, float, float, float]]:
+    """
+    Return the (to_logical, to_physical) transforms as (ax, bx, ay, by), so
+    each axis converts as floor(v * a + b). The rounding half-step is folded
+    into b, leaving one multiply-add per coordinate.
+    """
+    state = _current_state()
+    transforms = _STATE_CACHE["transforms"]
+    if transforms is None or _STATE_CACHE["state"] is not state:
+        if not state["calibrated"]:
+            raise RuntimeError("Not calibrated — run the 'calibrate' tool first")
+        sx, sy = state["scale_x"], state["scale_y"]
+        ox, oy = state["offset_x"], state["offset_y"]
+        # State files written before inv_scale_* was stored fall back to
+        # computing the inverse here.
+        inv_sx = state.get("inv_scale_x") or 1.0 / sx
+        inv_sy = state.get("inv_scale_y") or 1.0 / sy
+        transforms = (
+            (inv_sx, 0.5 - ox * inv_sx, inv_sy, 0.5 - oy * inv_sy),
+            (sx, ox + 0.5, sy, oy + 0.5),
+        )
+        if _STATE_CACHE["state"] is state:
+            _STATE_CACHE["transforms"] = transforms
+    return transforms
+
+
+def load_state() -> dict:
+    """Load persisted calibration state (a copy callers may modify freely)."""
+    return copy.deepcopy(_current_state())
+
+
+def save_state(state: dict) -> dict:
+    """Persist calibration state and return it, so callers needn't reload."""
     STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-    STATE_FILE.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    # Compact by default; PRECISION_DESKTOP_PRETTY=1 keeps it human-readable.
+    if os.environ.get("PRECISION_DESKTOP_PRETTY") == "1":
+        text = json.dumps(state, indent=2)
+    else:
+        text = json.dumps(state, separators=(",", ":"))
+    # Write to a temp file and swap it in, so a crash mid-write can't leave a
+    # truncated calibration.json behind.
+    tmp = STATE_FILE.with_suffix(".json.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, STATE_FILE)
+    _STATE_CACHE.update(
+        mtime=STATE_FILE.stat().st_mtime_ns, state=copy.deepcopy(state), transforms=None
+    )
+    return state
+
+
+def _median_small(xs: list[float]) -> float:
+    """Median of a short list (calibration uses a handful of points)."""
+    # Most calibrations use 2-3 points; take those without sorting.
+    n = len(xs)
+    if n == 1:
+        return xs[0]
+    if n == 2:
+        return 0.5 * (xs[0] + xs[1])
+    if n == 3:
+        a, b, c = xs
+        return max(min(a, b), min(max(a, b), c))
+    xs = sorted(xs)
+    return xs[n // 2] if n & 1 else 0.5 * (xs[n // 2 - 1] + xs[n // 2])
+
+
+def _fit_axis(pairs: list[tuple[int, int]]) -> tuple[float, int, float]:
+    """
+    Fit physical = logical * scale + offset along one axis.
+
+    Scale is the median physical/logical ratio. For standard DPI scaling the
+    offset should be 0; we compute it from the median residual just in case.
+    Returns (scale, offset, spread), spread being the relative range of the
+    per-point ratios.
+    """
+    scales = [phys / log for phys, log in pairs]
+    scale = _median_small(scales)
+    spread = (max(scales) - min(scales)) / scale if scale else 0
+    offset = round(_median_small([phys - log * scale for phys, log in pairs]))
+    return scale, offset, spread
 
 
 def compute_calibration(points: list[dict]) -> dict:
@@ -70,37 +162,34 @@ def compute_calibration(points: list[dict]) -> dict:
     if len(points) < 2:
         raise ValueError("Need at least 2 calibration points")
 
-    scales_x = []
-    scales_y = []
+    # One pass over the points: keep each usable (physical, logical) pair per axis.
+    pairs_x = []
+    pairs_y = []
 
     for p in points:
         if p["logical_x"] != 0:
-            scales_x.append(p["physical_x"] / p["logical_x"])
+            pairs_x.append((p["physical_x"], p["logical_x"]))
         if p["logical_y"] != 0:
-            scales_y.append(p["physical_y"] / p["logical_y"])
+            pairs_y.append((p["physical_y"], p["logical_y"]))
 
-    if not scales_x or not scales_y:
+    if not pairs_x or not pairs_y:
         raise ValueError("Cannot compute scale — logical coordinates contain zeros")
 
-    scale_x = statistics.median(scales_x)
-    scale_y = statistics.median(scales_y)
+    scale_x, offset_x, spread_x = _fit_axis(pairs_x)
+    scale_y, offset_y, spread_y = _fit_axis(pairs_y)
 
     # Check consistency — if points disagree by more than 2%, warn
-    spread_x = (max(scales_x) - min(scales_x)) / scale_x if scale_x else 0
-    spread_y = (max(scales_y) - min(scales_y)) / scale_y if scale_y else 0
     consistent = spread_x < 0.02 and spread_y < 0.02
 
-    # For standard DPI scaling, offset should be 0.
-    # We compute it from the median residual just in case.
-    offsets_x = [p["physical_x"] - p["logical_x"] * scale_x for p in points if p["logical_x"] != 0]
-    offsets_y = [p["physical_y"] - p["logical_y"] * scale_y for p in points if p["logical_y"] != 0]
-    offset_x = round(statistics.median(offsets_x)) if offsets_x else 0
-    offset_y = round(statistics.median(offsets_y)) if offsets_y else 0
+    scale_x = round(scale_x, 6)
+    scale_y = round(scale_y, 6)
 
     state = {
         "calibrated": True,
-        "scale_x": round(scale_x, 6),
-        "scale_y": round(scale_y, 6),
+        "scale_x": scale_x,
+        "scale_y": scale_y,
+        "inv_scale_x": 1.0 / scale_x if scale_x else None,
+        "inv_scale_y": 1.0 / scale_y if scale_y else None,
         "offset_x": offset_x,
         "offset_y": offset_y,
         "points": points,
@@ -110,8 +199,7 @@ def compute_calibration(points: list[dict]) -> dict:
         "spread_x": round(spread_x, 4),
         "spread_y": round(spread_y, 4),
     }
-    save_state(state)
-    return state
+    return save_state(state)
 
 
 def mark_verified(success: bool, notes: str = "") -> dict:
@@ -120,25 +208,31 @@ def mark_verified(success: bool, notes: str = "") -> dict:
     state["verified"] = success
     state["verification_notes"] = notes
     state["verified_at"] = datetime.now(timezone.utc).isoformat()
-    save_state(state)
-    return state
+    return save_state(state)
 
 
+# Conversions round half up with floor(v + 0.5): cheaper than round() and
+# consistent for the negative coordinates of monitors left of/above primary.
+
 def physical_to_logical(phys_x: int, phys_y: int) -> tuple[int, int]:
     """Convert physical coordinates to logical."""
-    state = load_state()
-    if not state["calibrated"]:
-        raise RuntimeError("Not calibrated — run the 'calibrate' tool first")
-    lx = round((phys_x - state["offset_x"]) / state["scale_x"])
-    ly = round((phys_y - state["offset_y"]) / state["scale_y"])
-    return lx, ly
+    ax, bx, ay, by = _transforms()[0]
+    return floor(phys_x * ax + bx), floor(phys_y * ay + by)
 
 
 def logical_to_physical(log_x: int, log_y: int) -> tuple[int, int]:
     """Convert logical coordinates to physical."""
-    state = load_state()
-    if not state["calibrated"]:
-        raise RuntimeError("Not calibrated — run the 'calibrate' tool first")
-    px = round(log_x * state["scale_x"] + state["offset_x"])
-    py = round(log_y * state["scale_y"] + state["offset_y"])
-    return px, py
+    ax, bx, ay, by = _transforms()[1]
+    return floor(log_x * ax + bx), floor(log_y * ay + by)
+
+
+def physical_to_logical_batch(points: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Convert a list of physical (x, y) pairs to logical in one pass."""
+    ax, bx, ay, by = _transforms()[0]
+    return [(floor(x * ax + bx), floor(y * ay + by)) for x, y in points]
+
+
+def logical_to_physical_batch(points: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """Convert a list of logical (x, y) pairs to physical in one pass."""
+    ax, bx, ay, by = _transforms()[1]
+    return [(floor(x * ax + bx), floor(y * ay + by)) for x, y in points]
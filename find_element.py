@@ -7,58 +7,499 @@ by name, automation ID, or class name within a window.
 Returns physical coordinates (ready for Click-Tool / Move-Tool).
 """
 
+import atexit
+import base64
+import functools
+import queue
 import subprocess
 import re
 import json
+import threading
+import time
+import uuid
+
+# Element lists can run to a hundred entries per call; orjson parses the
+# host's output in C when installed. Its JSONDecodeError subclasses json's.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Commands run once when the PowerShell host starts. Loading the UI Automation
+# assemblies here means individual queries don't pay for it. Errors are made
+# terminating (for this script block only) so a failed load is reported.
+_PS_PRELUDE = """
+$ErrorActionPreference = 'Stop'
+[Console]::OutputEncoding = New-Object System.Text.UTF8Encoding $false
+Add-Type -AssemblyName UIAutomationClient
+Add-Type -AssemblyName UIAutomationTypes
+"""
+
+# Query functions defined once per host. Each call is then a fixed function
+# invocation with quoted arguments (see _ps_quote), so user input is never
+# spliced into script text and the function bodies are parsed only once.
+_PS_FUNCTIONS = r"""
+function global:Get-SearchRoot([long]$Hwnd) {
+    if ($Hwnd -gt 0) {
+        return [System.Windows.Automation.AutomationElement]::FromHandle([IntPtr]$Hwnd)
+    }
+    return [System.Windows.Automation.AutomationElement]::RootElement
+}
+
+# Takes $element.Current or $element.Cached — both expose the same properties.
+function global:ConvertTo-ElementInfo($info) {
+    $rect = $info.BoundingRectangle
+    @{
+        name = $info.Name
+        x = [int]$rect.Left
+        y = [int]$rect.Top
+        width = [int]$rect.Width
+        height = [int]$rect.Height
+        center_x = [int]($rect.Left + $rect.Width / 2)
+        center_y = [int]($rect.Top + $rect.Height / 2)
+        control_type = $info.LocalizedControlType
+        automation_id = $info.AutomationId
+    }
+}
+
+# Properties we report, fetched for every match in the same cross-process call
+# as the search instead of one round-trip per property read. Activate it
+# around FindAll and read $element.Cached.
+$global:ElementCache = New-Object System.Windows.Automation.CacheRequest
+$global:ElementCache.Add([System.Windows.Automation.AutomationElement]::NameProperty)
+$global:ElementCache.Add([System.Windows.Automation.AutomationElement]::LocalizedControlTypeProperty)
+$global:ElementCache.Add([System.Windows.Automation.AutomationElement]::BoundingRectangleProperty)
+$global:ElementCache.Add([System.Windows.Automation.AutomationElement]::AutomationIdProperty)
+$global:ElementCache.AutomationElementMode = [System.Windows.Automation.AutomationElementMode]::None
+
+# Same idea for the top-level window scan in Find-WindowHandle.
+$global:WindowCache = New-Object System.Windows.Automation.CacheRequest
+$global:WindowCache.Add([System.Windows.Automation.AutomationElement]::NameProperty)
+$global:WindowCache.Add([System.Windows.Automation.AutomationElement]::NativeWindowHandleProperty)
+$global:WindowCache.AutomationElementMode = [System.Windows.Automation.AutomationElementMode]::None
+
+function global:Find-WindowHandle([string]$Title) {
+    $root = [System.Windows.Automation.AutomationElement]::RootElement
+    $condition = New-Object System.Windows.Automation.PropertyCondition(
+        [System.Windows.Automation.AutomationElement]::NameProperty,
+        $Title,
+        [System.Windows.Automation.PropertyConditionFlags]::IgnoreCase)
+    $scope = $global:WindowCache.Activate()
+    try {
+        $window = $root.FindFirst(
+            [System.Windows.Automation.TreeScope]::Children, $condition)
+        if ($null -ne $window) {
+            Write-Output $window.Cached.NativeWindowHandle
+            return
+        }
+        # Fallback: partial match via substring
+        $all = $root.FindAll(
+            [System.Windows.Automation.TreeScope]::Children,
+            [System.Windows.Automation.Condition]::TrueCondition)
+    } finally {
+        $scope.Dispose()
+    }
+    foreach ($w in $all) {
+        if ($w.Cached.Name.IndexOf($Title, [System.StringComparison]::OrdinalIgnoreCase) -ge 0) {
+            Write-Output $w.Cached.NativeWindowHandle
+            return
+        }
+    }
+}
+
+function global:Find-ElementByName([string]$Name, [long]$Hwnd) {
+    $searchRoot = Get-SearchRoot $Hwnd
+    if ($null -eq $searchRoot) {
+        Write-Output "WINDOW_NOT_FOUND"
+        return
+    }
+    $condition = New-Object System.Windows.Automation.PropertyCondition(
+        [System.Windows.Automation.AutomationElement]::NameProperty, $Name)
+    $scope = $global:ElementCache.Activate()
+    try {
+        $element = $searchRoot.FindFirst(
+            [System.Windows.Automation.TreeScope]::Descendants, $condition)
+    } finally {
+        $scope.Dispose()
+    }
+    if ($null -ne $element) {
+        ConvertTo-ElementInfo $element.Cached | ConvertTo-Json -Compress
+    } else {
+        Write-Output "NOT_FOUND"
+    }
+}
+
+function global:Find-ElementsByName([string]$Name, [long]$Hwnd) {
+    $searchRoot = Get-SearchRoot $Hwnd
+    if ($null -eq $searchRoot) {
+        Write-Output "[]"
+        return
+    }
+    $condition = New-Object System.Windows.Automation.PropertyCondition(
+        [System.Windows.Automation.AutomationElement]::NameProperty, $Name)
+    $scope = $global:ElementCache.Activate()
+    try {
+        $elements = $searchRoot.FindAll(
+            [System.Windows.Automation.TreeScope]::Descendants, $condition)
+    } finally {
+        $scope.Dispose()
+    }
+    $results = @()
+    foreach ($element in $elements) {
+        $results += ConvertTo-ElementInfo $element.Cached
+    }
+    $results | ConvertTo-Json -Compress
+}
+
+# Named elements of interactive control types. Filtering inside UI Automation
+# means non-interactive descendants never get marshalled back to PowerShell.
+$typeConds = foreach ($t in @(
+    [System.Windows.Automation.ControlType]::Button,
+    [System.Windows.Automation.ControlType]::Edit,
+    [System.Windows.Automation.ControlType]::Text,
+    [System.Windows.Automation.ControlType]::Hyperlink,
+    [System.Windows.Automation.ControlType]::MenuItem,
+    [System.Windows.Automation.ControlType]::TabItem,
+    [System.Windows.Automation.ControlType]::ListItem,
+    [System.Windows.Automation.ControlType]::CheckBox,
+    [System.Windows.Automation.ControlType]::RadioButton,
+    [System.Windows.Automation.ControlType]::ComboBox,
+    [System.Windows.Automation.ControlType]::Slider)) {
+    New-Object System.Windows.Automation.PropertyCondition(
+        [System.Windows.Automation.AutomationElement]::ControlTypeProperty, $t)
+}
+$unnamed = New-Object System.Windows.Automation.PropertyCondition(
+    [System.Windows.Automation.AutomationElement]::NameProperty, "")
+$global:InteractiveCondition = [System.Windows.Automation.AndCondition]::new(
+    [System.Windows.Automation.Condition[]]@(
+        [System.Windows.Automation.OrCondition]::new(
+            [System.Windows.Automation.Condition[]]$typeConds),
+        (New-Object System.Windows.Automation.NotCondition($unnamed))))
+
+function global:Get-WindowElements([long]$Hwnd) {
+    $searchRoot = Get-SearchRoot $Hwnd
+    if ($null -eq $searchRoot) {
+        Write-Output "[]"
+        return
+    }
+    $scope = $global:ElementCache.Activate()
+    try {
+        $elements = $searchRoot.FindAll(
+            [System.Windows.Automation.TreeScope]::Descendants, $global:InteractiveCondition)
+    } finally {
+        $scope.Dispose()
+    }
+    $results = @()
+    $count = 0
+    foreach ($element in $elements) {
+        $info = $element.Cached
+        $rect = $info.BoundingRectangle
+        if ($rect.Width -gt 0 -and $rect.Height -gt 0) {
+            $results += ConvertTo-ElementInfo $info
+            $count++
+            if ($count -ge 100) { break }
+        }
+    }
+    $results | ConvertTo-Json -Compress
+}
+"""
+
+_ERR_PREFIX = "###ERR###"
+
+
+class PowerShellError(RuntimeError):
+    """
+    A script raised inside the host. Carries the .NET exception type name and
+    HResult of the first error so callers can tell UIA failures apart. These
+    describe the base exception: PowerShell wraps failures of .NET calls such
+    as FindFirst in MethodInvocationException.
+    """
+
+    def __init__(self, message: str, exception_type: str = "", hresult: int | None = None):
+        super().__init__(message)
+        self.exception_type = exception_type
+        self.hresult = hresult
+
+
+class PowerShellUnavailableError(RuntimeError):
+    """The PowerShell host could not be launched or written to."""
+
+
+# A single long-lived powershell.exe that reads scripts from stdin. Starting
+# PowerShell costs several hundred ms, so it is started once and reused.
+_PS_HOST = {"proc": None, "lines": None}
+_PS_LOCK = threading.Lock()
+
+
+def _pump_lines(stream, lines: queue.Queue) -> None:
+    """Forward host stdout lines to a queue so reads can time out."""
+    for line in stream:
+        lines.put(line.rstrip("\r\n").lstrip("\ufeff"))
+    lines.put(None)
+
+
+def _stop_host() -> None:
+    proc = _PS_HOST["proc"]
+    _PS_HOST.update(proc=None, lines=None)
+    if proc is not None and proc.poll() is None:
+        proc.kill()
+
+
+def _start_host() -> None:
+    # UI Automation clients should call from an MTA thread: in PowerShell's
+    # default STA every UIA call is marshalled through the apartment's message
+    # loop. The host is started once, so the apartment is set up only once.
+    try:
+        proc = subprocess.Popen(
+            ["powershell", "-MTA", "-NoProfile", "-NonInteractive", "-Command", "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+        )
+    except OSError as e:
+        raise PowerShellUnavailableError(f"Could not start PowerShell: {e}") from e
+    lines: queue.Queue = queue.Queue()
+    threading.Thread(target=_pump_lines, args=(proc.stdout, lines), daemon=True).start()
+    _PS_HOST.update(proc=proc, lines=lines)
+    # A failed Add-Type or function definition would otherwise only show up
+    # later as every query failing with "term ... is not recognized".
+    try:
+        _raise_errors(_exchange(_PS_PRELUDE, timeout=30))
+        _raise_errors(_exchange(_PS_FUNCTIONS, timeout=30))
+    except PowerShellError as e:
+        _stop_host()
+        raise PowerShellError(
+            f"PowerShell host failed to initialize: {e}", e.exception_type, e.hresult
+        ) from e
+
+
+# PowerShell treats the typographic quotes U+2018-U+201B as single quotes
+# too, so each of them must be doubled along with the ASCII one.
+_PS_SINGLE_QUOTES = re.compile("['\u2018\u2019\u201a\u201b]")
+
+
+def _ps_quote(value: str) -> str:
+    """Quote a value as a PowerShell single-quoted string literal."""
+    return "'" + _PS_SINGLE_QUOTES.sub(lambda m: m.group(0) * 2, value) + "'"
+
+
+def _exchange(script: str, timeout: int) -> list[str]:
+    """
+    Send one script to the host and collect its output lines.
+
+    The script travels base64-encoded on a single stdin line and runs in its
+    own script block, bracketed by begin/end markers unique to this call.
+    Caller must hold _PS_LOCK.
+    """
+    token = uuid.uuid4().hex
+    encoded = base64.b64encode(script.encode("utf-8")).decode("ascii")
+    command = (
+        f"Write-Output '###BEGIN###{token}'; "
+        f"try {{ & ([scriptblock]::Create([Text.Encoding]::UTF8.GetString("
+        f"[Convert]::FromBase64String('{encoded}')))) }} "
+        f"catch {{ $_.Exception.GetBaseException() | ForEach-Object {{ "
+        f"Write-Output ('{_ERR_PREFIX}' + $_.GetType().Name + '|' + $_.HResult + '|' + "
+        f"($_.Message -replace '\\r?\\n', ' ')) }} }}; "
+        f"Write-Output '###END###{token}'\n"
+    )
+
+    proc, lines = _PS_HOST["proc"], _PS_HOST["lines"]
+    try:
+        proc.stdin.write(command)
+        proc.stdin.flush()
+    except OSError as e:
+        _stop_host()
+        raise PowerShellUnavailableError(f"PowerShell host unavailable: {e}") from e
+
+    deadline = time.monotonic() + timeout
+    output = []
+    started = False
+    while True:
+        try:
+            line = lines.get(timeout=max(deadline - time.monotonic(), 0))
+        except queue.Empty:
+            _stop_host()
+            raise subprocess.TimeoutExpired("powershell", timeout)
+        if line is None:
+            _stop_host()
+            raise RuntimeError("PowerShell host exited unexpectedly")
+        if line == f"###BEGIN###{token}":
+            started = True
+        elif line == f"###END###{token}":
+            return output
+        elif started:
+            output.append(line)
+
+
+def _raise_errors(output: list[str]) -> None:
+    """Raise PowerShellError if the host reported errors in this output."""
+    errors = [
+        line[len(_ERR_PREFIX):].split("|", 2)
+        for line in output if line.startswith(_ERR_PREFIX)
+    ]
+    if errors:
+        exception_type, hresult, _ = errors[0]
+        raise PowerShellError(
+            f"PowerShell error: {'; '.join(message for _, _, message in errors)}",
+            exception_type,
+            int(hresult) if hresult.lstrip("-").isdigit() else None,
+        )
+
+
+def _run_ps_lines(script: str, timeout: int = 10) -> list[str]:
+    """Run a PowerShell script and return its stdout lines."""
+    with _PS_LOCK:
+        proc = _PS_HOST["proc"]
+        if proc is None or proc.poll() is not None:
+            _start_host()
+        output = _exchange(script, timeout)
+
+    _raise_errors(output)
+    return output
 
 
 def _run_ps(script: str, timeout: int = 10) -> str:
     """Run a PowerShell script and return stdout."""
+    return "\n".join(_run_ps_lines(script, timeout)).strip()
+
+
+def _run_ps_json(script: str, timeout: int = 10):
+    """
+    Run a script that prints either compressed JSON or a bare sentinel word
+    (NOT_FOUND, WINDOW_NOT_FOUND). Returns the parsed JSON, or None for a
+    sentinel, empty output, or unparseable output.
+    """
+    lines = [line for line in _run_ps_lines(script, timeout) if line]
+    if not lines or lines[0].lstrip()[:1] not in ("[", "{"):
+        return None
+    try:
+        return _json_loads("\n".join(lines))
+    except json.JSONDecodeError:
+        return None
+
+
+def _as_list(parsed) -> list[dict]:
+    """ConvertTo-Json emits a bare object for one-element arrays."""
+    if parsed is None:
+        return []
+    if isinstance(parsed, dict):
+        return [parsed]
+    return parsed
+
+
+atexit.register(_stop_host)
+
+
+def warm_up() -> None:
+    """
+    Start the PowerShell host and make one trivial UIA query against the
+    desktop root, so the first real lookup doesn't pay for host startup and
+    the UIA client's cold start. Failures are left for that lookup to report.
+    """
+    try:
+        _run_ps_lines(
+            "[void](Get-SearchRoot 0).FindFirst("
+            "[System.Windows.Automation.TreeScope]::Children, "
+            "[System.Windows.Automation.Condition]::TrueCondition)",
+            timeout=30,
+        )
+    except (OSError, RuntimeError, subprocess.TimeoutExpired):
+        pass
+
+
+def run_standalone_ps(script: str, timeout: int = 10) -> str:
+    """
+    Run a script in its own short-lived powershell.exe and return stdout.
+
+    For probes that must not depend on the shared host: it has already
+    loaded the UI Automation assemblies, and its lock may be held by a long
+    walk.
+    """
     result = subprocess.run(
         ["powershell", "-NoProfile", "-NonInteractive", "-Command", script],
         capture_output=True,
         text=True,
         timeout=timeout,
     )
-    if result.returncode != 0 and result.stderr.strip():
-        raise RuntimeError(f"PowerShell error: {result.stderr.strip()}")
     return result.stdout.strip()
 
 
 def find_window_handle(title_substring: str) -> int | None:
     """Find a window handle by title substring."""
-    script = f'''
-Add-Type -AssemblyName UIAutomationClient
-Add-Type -AssemblyName UIAutomationTypes
-$root = [System.Windows.Automation.AutomationElement]::RootElement
-$condition = New-Object System.Windows.Automation.PropertyCondition(
-    [System.Windows.Automation.AutomationElement]::NameProperty,
-    "{title_substring}",
-    [System.Windows.Automation.PropertyConditionFlags]::IgnoreCase)
-$windows = $root.FindAll(
-    [System.Windows.Automation.TreeScope]::Children, $condition)
-if ($windows.Count -gt 0) {{
-    $hwnd = $windows[0].Current.NativeWindowHandle
-    Write-Output $hwnd
-}} else {{
-    # Fallback: partial match via substring
-    $all = $root.FindAll(
-        [System.Windows.Automation.TreeScope]::Children,
-        [System.Windows.Automation.Condition]::TrueCondition)
-    foreach ($w in $all) {{
-        if ($w.Current.Name -like "*{title_substring}*") {{
-            Write-Output $w.Current.NativeWindowHandle
-            break
-        }}
-    }}
-}}
-'''
-    output = _run_ps(script)
+    output = _run_ps(f"Find-WindowHandle -Title {_ps_quote(title_substring)}")
     if output and output.strip().isdigit():
         return int(output.strip())
     return None
 
 
+# title_substring -> (resolved_at, hwnd) for windows already located by title,
+# so repeated title-scoped searches use FromHandle instead of walking the
+# top-level windows. Entries expire after WINDOW_CACHE_TTL seconds; misses
+# are not cached, so a window opened later is still found.
+WINDOW_CACHE_TTL = 5.0
+_WINDOW_CACHE: dict[str, tuple[float, int]] = {}
+_WINDOW_CACHE_SIZE = 64
+# Guards every write: resolve_window runs on several pool threads, and
+# eviction must not iterate the dict while another thread changes it.
+_WINDOW_CACHE_LOCK = threading.Lock()
+
+
+def _cached_window(title_substring: str) -> int | None:
+    entry = _WINDOW_CACHE.get(title_substring)
+    if entry is None:
+        return None
+    if time.monotonic() - entry[0] > WINDOW_CACHE_TTL:
+        with _WINDOW_CACHE_LOCK:
+            _WINDOW_CACHE.pop(title_substring, None)
+        return None
+    return entry[1]
+
+
+def resolve_window(title_substring: str) -> int | None:
+    """Return the hwnd for a window title, using the cache when possible."""
+    hwnd = _cached_window(title_substring)
+    if hwnd is None:
+        hwnd = find_window_handle(title_substring)
+        if hwnd is not None:
+            with _WINDOW_CACHE_LOCK:
+                if len(_WINDOW_CACHE) >= _WINDOW_CACHE_SIZE:
+                    _WINDOW_CACHE.pop(next(iter(_WINDOW_CACHE)), None)
+                _WINDOW_CACHE[title_substring] = (time.monotonic(), hwnd)
+    return hwnd
+
+
+def invalidate_window_cache() -> None:
+    """Forget cached window handles (e.g. after windows were closed)."""
+    with _WINDOW_CACHE_LOCK:
+        _WINDOW_CACHE.clear()
+
+
+def _search_window(window_title: str, search, not_found):
+    """
+    Run search(window_handle=hwnd) against the window matching window_title.
+
+    If the handle came from the cache and the search fails, the window may
+    have closed, so the handle is resolved again and the search retried once.
+    """
+    cached = _cached_window(window_title) is not None
+    hwnd = resolve_window(window_title)
+    if hwnd is None:
+        return not_found
+    try:
+        return search(window_handle=hwnd)
+    except RuntimeError:
+        if not cached:
+            raise
+    with _WINDOW_CACHE_LOCK:
+        _WINDOW_CACHE.pop(window_title, None)
+    hwnd = resolve_window(window_title)
+    if hwnd is None:
+        return not_found
+    return search(window_handle=hwnd)
+
+
 def find_element_by_name(
     element_name: str,
     window_title: str | None = None,
@@ -77,83 +518,18 @@ def find_element_by_name(
         control_type, automation_id. Coordinates are PHYSICAL.
         Returns None if not found.
     """
-    if window_handle:
-        root_expr = f"[System.Windows.Automation.AutomationElement]::FromHandle([IntPtr]{window_handle})"
-    elif window_title:
-        # Find window first, then search within it
-        root_expr = f'''$(
-            $root = [System.Windows.Automation.AutomationElement]::RootElement
-            $wCond = New-Object System.Windows.Automation.PropertyCondition(
-                [System.Windows.Automation.AutomationElement]::NameProperty,
-                "{window_title}",
-                [System.Windows.Automation.PropertyConditionFlags]::IgnoreCase)
-            $wins = $root.FindAll(
-                [System.Windows.Automation.TreeScope]::Children, $wCond)
-            if ($wins.Count -eq 0) {{
-                # Partial match fallback
-                $all = $root.FindAll(
-                    [System.Windows.Automation.TreeScope]::Children,
-                    [System.Windows.Automation.Condition]::TrueCondition)
-                $found = $null
-                foreach ($w in $all) {{
-                    if ($w.Current.Name -like "*{window_title}*") {{
-                        $found = $w; break
-                    }}
-                }}
-                $found
-            }} else {{
-                $wins[0]
-            }}
-        )'''
-    else:
-        root_expr = "[System.Windows.Automation.AutomationElement]::RootElement"
-
-    # Escape double quotes in element name for PowerShell
-    safe_name = element_name.replace('"', '`"')
-
-    script = f'''
-Add-Type -AssemblyName UIAutomationClient
-Add-Type -AssemblyName UIAutomationTypes
-$searchRoot = {root_expr}
-if ($null -eq $searchRoot) {{
-    Write-Output "WINDOW_NOT_FOUND"
-    exit
-}}
-$condition = New-Object System.Windows.Automation.PropertyCondition(
-    [System.Windows.Automation.AutomationElement]::NameProperty, "{safe_name}")
-$element = $searchRoot.FindFirst(
-    [System.Windows.Automation.TreeScope]::Descendants, $condition)
-if ($null -ne $element) {{
-    $rect = $element.Current.BoundingRectangle
-    $cx = [int]($rect.Left + $rect.Width / 2)
-    $cy = [int]($rect.Top + $rect.Height / 2)
-    $result = @{{
-        name = $element.Current.Name
-        x = [int]$rect.Left
-        y = [int]$rect.Top
-        width = [int]$rect.Width
-        height = [int]$rect.Height
-        center_x = $cx
-        center_y = $cy
-        control_type = $element.Current.LocalizedControlType
-        automation_id = $element.Current.AutomationId
-    }}
-    $result | ConvertTo-Json -Compress
-}} else {{
-    Write-Output "NOT_FOUND"
-}}
-'''
-    output = _run_ps(script, timeout=15)
-
-    if not output or output == "NOT_FOUND":
-        return None
-    if output == "WINDOW_NOT_FOUND":
-        return None
+    if window_title and not window_handle:
+        return _search_window(
+            window_title,
+            functools.partial(find_element_by_name, element_name),
+            None,
+        )
 
-    try:
-        return json.loads(output)
-    except json.JSONDecodeError:
-        return None
+    result = _run_ps_json(
+        f"Find-ElementByName -Name {_ps_quote(element_name)} -Hwnd {int(window_handle or 0)}",
+        timeout=15,
+    )
+    return result if isinstance(result, dict) else None
 
 
 def find_elements_by_name(
@@ -165,80 +541,17 @@ def find_elements_by_name(
     Find ALL UI elements matching a Name property.
     Same args as find_element_by_name but returns a list.
     """
-    if window_handle:
-        root_expr = f"[System.Windows.Automation.AutomationElement]::FromHandle([IntPtr]{window_handle})"
-    elif window_title:
-        root_expr = f'''$(
-            $root = [System.Windows.Automation.AutomationElement]::RootElement
-            $wCond = New-Object System.Windows.Automation.PropertyCondition(
-                [System.Windows.Automation.AutomationElement]::NameProperty,
-                "{window_title}",
-                [System.Windows.Automation.PropertyConditionFlags]::IgnoreCase)
-            $wins = $root.FindAll(
-                [System.Windows.Automation.TreeScope]::Children, $wCond)
-            if ($wins.Count -eq 0) {{
-                $all = $root.FindAll(
-                    [System.Windows.Automation.TreeScope]::Children,
-                    [System.Windows.Automation.Condition]::TrueCondition)
-                $found = $null
-                foreach ($w in $all) {{
-                    if ($w.Current.Name -like "*{window_title}*") {{
-                        $found = $w; break
-                    }}
-                }}
-                $found
-            }} else {{
-                $wins[0]
-            }}
-        )'''
-    else:
-        root_expr = "[System.Windows.Automation.AutomationElement]::RootElement"
-
-    safe_name = element_name.replace('"', '`"')
-
-    script = f'''
-Add-Type -AssemblyName UIAutomationClient
-Add-Type -AssemblyName UIAutomationTypes
-$searchRoot = {root_expr}
-if ($null -eq $searchRoot) {{
-    Write-Output "[]"
-    exit
-}}
-$condition = New-Object System.Windows.Automation.PropertyCondition(
-    [System.Windows.Automation.AutomationElement]::NameProperty, "{safe_name}")
-$elements = $searchRoot.FindAll(
-    [System.Windows.Automation.TreeScope]::Descendants, $condition)
-$results = @()
-foreach ($element in $elements) {{
-    $rect = $element.Current.BoundingRectangle
-    $cx = [int]($rect.Left + $rect.Width / 2)
-    $cy = [int]($rect.Top + $rect.Height / 2)
-    $results += @{{
-        name = $element.Current.Name
-        x = [int]$rect.Left
-        y = [int]$rect.Top
-        width = [int]$rect.Width
-        height = [int]$rect.Height
-        center_x = $cx
-        center_y = $cy
-        control_type = $element.Current.LocalizedControlType
-        automation_id = $element.Current.AutomationId
-    }}
-}}
-$results | ConvertTo-Json -Compress
-'''
-    output = _run_ps(script, timeout=15)
-
-    if not output or output == "[]":
-        return []
+    if window_title and not window_handle:
+        return _search_window(
+            window_title,
+            functools.partial(find_elements_by_name, element_name),
+            [],
+        )
 
-    try:
-        parsed = json.loads(output)
-        if isinstance(parsed, dict):
-            return [parsed]
-        return parsed
-    except json.JSONDecodeError:
-        return []
+    return _as_list(_run_ps_json(
+        f"Find-ElementsByName -Name {_ps_quote(element_name)} -Hwnd {int(window_handle or 0)}",
+        timeout=15,
+    ))
 
 
 def list_window_elements(
@@ -250,69 +563,11 @@ def list_window_elements(
     List all named interactive elements in a window (buttons, text fields, etc.).
     Useful for discovering what's available before targeting a specific element.
     """
-    if window_handle:
-        root_expr = f"[System.Windows.Automation.AutomationElement]::FromHandle([IntPtr]{window_handle})"
-    elif window_title:
-        root_expr = f'''$(
-            $root = [System.Windows.Automation.AutomationElement]::RootElement
-            $all = $root.FindAll(
-                [System.Windows.Automation.TreeScope]::Children,
-                [System.Windows.Automation.Condition]::TrueCondition)
-            $found = $null
-            foreach ($w in $all) {{
-                if ($w.Current.Name -like "*{window_title}*") {{
-                    $found = $w; break
-                }}
-            }}
-            $found
-        )'''
-    else:
-        root_expr = "[System.Windows.Automation.AutomationElement]::RootElement"
-
-    script = f'''
-Add-Type -AssemblyName UIAutomationClient
-Add-Type -AssemblyName UIAutomationTypes
-$searchRoot = {root_expr}
-if ($null -eq $searchRoot) {{
-    Write-Output "[]"
-    exit
-}}
-$elements = $searchRoot.FindAll(
-    [System.Windows.Automation.TreeScope]::Descendants,
-    [System.Windows.Automation.Condition]::TrueCondition)
-$results = @()
-$interactive = @("button", "edit", "text", "hyperlink", "menu item", "tab item",
-                 "list item", "check box", "radio button", "combo box", "slider")
-$count = 0
-foreach ($element in $elements) {{
-    $ct = $element.Current.LocalizedControlType
-    $name = $element.Current.Name
-    if ($name -and ($interactive -contains $ct)) {{
-        $rect = $element.Current.BoundingRectangle
-        if ($rect.Width -gt 0 -and $rect.Height -gt 0) {{
-            $results += @{{
-                name = $name
-                control_type = $ct
-                center_x = [int]($rect.Left + $rect.Width / 2)
-                center_y = [int]($rect.Top + $rect.Height / 2)
-                automation_id = $element.Current.AutomationId
-            }}
-            $count++
-            if ($count -ge 100) {{ break }}
-        }}
-    }}
-}}
-$results | ConvertTo-Json -Compress
-'''
-    output = _run_ps(script, timeout=20)
-
-    if not output or output == "[]":
-        return []
+    if window_title and not window_handle:
+        return _search_window(
+            window_title,
+            functools.partial(list_window_elements, max_depth=max_depth),
+            [],
+        )
 
-    try:
-        parsed = json.loads(output)
-        if isinstance(parsed, dict):
-            return [parsed]
-        return parsed
-    except json.JSONDecodeError:
-        return []
+    return _as_list(_run_ps_json(f"Get-WindowElements -Hwnd {int(window_handle or 0)}", timeout=20))
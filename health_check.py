@@ -8,13 +8,16 @@ Checks:
 4. Is windows-mcp patched (future: LLM-adaptive patching)?
 """
 
+import functools
 import os
 import subprocess
 import json
+import time
 from pathlib import Path
-from datetime import datetime, timezone, timedelta
+from datetime import datetime
 
 from calibration import load_state as load_calibration
+from find_element import run_standalone_ps
 
 # windows-mcp install location — configurable via environment variable,
 # defaults to standard Claude Extensions path for any user
@@ -28,14 +31,13 @@ WINDOWS_MCP_PATH = Path(
 )
 
 
-def _run_ps(script: str, timeout: int = 10) -> str:
-    result = subprocess.run(
-        ["powershell", "-NoProfile", "-NonInteractive", "-Command", script],
-        capture_output=True,
-        text=True,
-        timeout=timeout,
-    )
-    return result.stdout.strip()
+STALE_AFTER_SECONDS = 7 * 86400
+
+
+@functools.lru_cache(maxsize=1)
+def _calibrated_epoch(calibrated_at: str) -> float:
+    """Parse a calibrated_at timestamp once; repeated checks reuse the result."""
+    return datetime.fromisoformat(calibrated_at).timestamp()
 
 
 def check_calibration() -> dict:
@@ -51,11 +53,12 @@ def check_calibration() -> dict:
 
     cal_time = state.get("calibrated_at")
     if cal_time:
-        cal_dt = datetime.fromisoformat(cal_time)
-        age = datetime.now(timezone.utc) - cal_dt
-        stale = age > timedelta(days=7)
+        age_sec = time.time() - _calibrated_epoch(cal_time)
+        stale = age_sec > STALE_AFTER_SECONDS
+        age_message = f"Calibration is {int(age_sec // 86400)} days old."
     else:
         stale = True
+        age_message = "Calibration has no timestamp."
 
     verified = state.get("verified", False)
     consistent = state.get("consistent", True)
@@ -63,7 +66,7 @@ def check_calibration() -> dict:
     if stale:
         return {
             "status": "stale",
-            "message": f"Calibration is {age.days} days old. Consider re-calibrating.",
+            "message": f"{age_message} Consider re-calibrating.",
             "scale_x": state.get("scale_x"),
             "scale_y": state.get("scale_y"),
             "action_needed": True,
@@ -99,7 +102,7 @@ def check_calibration() -> dict:
 def check_ui_automation() -> dict:
     """Check that PowerShell UI Automation assemblies are loadable."""
     try:
-        output = _run_ps(
+        output = run_standalone_ps(
             'Add-Type -AssemblyName UIAutomationClient; '
             'Add-Type -AssemblyName UIAutomationTypes; '
             'Write-Output "OK"'
@@ -115,17 +118,23 @@ def check_ui_automation() -> dict:
 
 def check_windows_mcp() -> dict:
     """Check windows-mcp installation status."""
-    if not WINDOWS_MCP_PATH.exists():
+    # One directory listing instead of a stat per file — these paths often
+    # live on a roaming %APPDATA% profile where each stat is a round-trip.
+    # Names are lowercased to match NTFS's case-insensitive lookups.
+    try:
+        with os.scandir(WINDOWS_MCP_PATH) as it:
+            entries = {e.name.lower(): e for e in it}
+    except OSError:
         return {
             "status": "missing",
             "message": "windows-mcp not found at expected path",
             "path": str(WINDOWS_MCP_PATH),
         }
 
-    main_py = WINDOWS_MCP_PATH / "main.py"
-    manifest = WINDOWS_MCP_PATH / "manifest.json"
+    main_py = entries.get("main.py")
+    manifest = entries.get("manifest.json")
 
-    if not main_py.exists():
+    if main_py is None:
         return {
             "status": "error",
             "message": "windows-mcp directory exists but main.py missing",
@@ -133,9 +142,9 @@ def check_windows_mcp() -> dict:
         }
 
     version = "unknown"
-    if manifest.exists():
+    if manifest is not None:
         try:
-            mf = json.loads(manifest.read_text(encoding="utf-8"))
+            mf = json.loads(Path(manifest.path).read_text(encoding="utf-8"))
             version = mf.get("version", "unknown")
         except Exception:
             pass
@@ -149,14 +158,21 @@ def check_windows_mcp() -> dict:
     }
 
 
+# Independent checks, in report order. The server runs them concurrently.
+CHECKS = {
+    "calibration": check_calibration,
+    "ui_automation": check_ui_automation,
+    "windows_mcp": check_windows_mcp,
+}
+
+
 def run_all_checks() -> dict:
     """Run all health checks and return combined report."""
-    checks = {
-        "calibration": check_calibration(),
-        "ui_automation": check_ui_automation(),
-        "windows_mcp": check_windows_mcp(),
-    }
+    return summarize({name: check() for name, check in CHECKS.items()})
+
 
+def summarize(checks: dict) -> dict:
+    """Add the "overall" entry to a dict of individual check results."""
     any_action = any(c.get("action_needed") for c in checks.values())
     any_error = any(c.get("status") == "error" for c in checks.values())
 
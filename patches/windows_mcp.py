@@ -58,26 +58,43 @@ PATCH_INTENTS = [
 ]
 
 
+_PATCH_BY_ID = {p["id"]: p for p in PATCH_INTENTS}
+
+# Source marker whose presence in main.py means the patch is applied
+_PATCH_NEEDLES = {
+    "dpi_awareness": "coordinate_system",
+    "find_and_click": "element_name",
+}
+
+# Last status computed, keyed on main.py's (mtime_ns, size) so unchanged
+# source is not re-read and re-scanned on every call.
+_PATCH_STATUS_CACHE: tuple[tuple[int, int], list[dict]] | None = None
+
+
 def get_patch_status() -> list[dict]:
     """
     Check which patches are applied by reading current windows-mcp source.
     Returns list of patches with their current status.
     """
+    global _PATCH_STATUS_CACHE
+
     main_py = WINDOWS_MCP_PATH / "main.py"
-    if not main_py.exists():
+    try:
+        st = main_py.stat()
+    except FileNotFoundError:
         return [{"id": p["id"], "status": "cannot_check", "reason": "main.py not found"}
                 for p in PATCH_INTENTS]
 
+    key = (st.st_mtime_ns, st.st_size)
+    if _PATCH_STATUS_CACHE is not None and _PATCH_STATUS_CACHE[0] == key:
+        return [dict(r) for r in _PATCH_STATUS_CACHE[1]]
+
     source = main_py.read_text(encoding="utf-8")
     results = []
 
     for patch in PATCH_INTENTS:
-        if patch["id"] == "dpi_awareness":
-            applied = "coordinate_system" in source
-        elif patch["id"] == "find_and_click":
-            applied = "element_name" in source
-        else:
-            applied = False
+        needle = _PATCH_NEEDLES.get(patch["id"])
+        applied = needle is not None and needle in source
 
         results.append({
             "id": patch["id"],
@@ -87,6 +104,7 @@ def get_patch_status() -> list[dict]:
             "priority": patch["priority"],
         })
 
+    _PATCH_STATUS_CACHE = (key, [dict(r) for r in results])
     return results
 
 
@@ -95,14 +113,14 @@ def get_patch_prompt(patch_id: str) -> str | None:
     Get the prompt that Claude Code should use to apply a specific patch.
     Returns None if patch_id is unknown.
     """
-    for patch in PATCH_INTENTS:
-        if patch["id"] == patch_id:
-            main_py = WINDOWS_MCP_PATH / "main.py"
-            return (
-                f"Read the file at {main_py} and modify it to implement this change:\n\n"
-                f"**{patch['description']}**\n\n"
-                f"{patch['intent'].strip()}\n\n"
-                f"Make minimal changes. Preserve all existing functionality. "
-                f"Add the new parameter as optional with backward-compatible defaults."
-            )
-    return None
+    patch = _PATCH_BY_ID.get(patch_id)
+    if patch is None:
+        return None
+    main_py = WINDOWS_MCP_PATH / "main.py"
+    return (
+        f"Read the file at {main_py} and modify it to implement this change:\n\n"
+        f"**{patch['description']}**\n\n"
+        f"{patch['intent'].strip()}\n\n"
+        f"Make minimal changes. Preserve all existing functionality. "
+        f"Add the new parameter as optional with backward-compatible defaults."
+    )
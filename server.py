@@ -10,8 +10,11 @@ Companion MCP for windows-mcp providing:
 """
 
 import asyncio
+import atexit
 import json
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
@@ -21,345 +24,682 @@ import find_element
 import health_check
 from patches import windows_mcp as patches
 
+
+# Tool results are serialized compactly — indentation only costs time and
+# stdio bandwidth for a machine reader. orjson is used when installed.
+def _json_dumps(obj) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # orjson rejects ints beyond 64 bits; json handles them.
+            return _json_dumps(obj)
+except ImportError:
+    _dumps = _json_dumps
+
+# Tool arguments are checked against each inputSchema up front when
+# jsonschema is available (the MCP SDK normally pulls it in), so misuse is
+# reported as invalid_args instead of surfacing as a KeyError mid-handler.
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
 server = Server("precision-desktop")
 
+# UI Automation calls go through a small dedicated pool. They all share one
+# PowerShell host that serves a single query at a time (find_element's
+# _PS_LOCK), so walks take turns; the second worker lets cached window
+# lookups answer while a walk holds the host. Health/patch checks get their
+# own pool and stay off the shared host (the UIA probe starts its own
+# PowerShell), so they don't queue behind a slow walk.
+UIA_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="uia")
+AUX_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="aux")
+atexit.register(UIA_POOL.shutdown, wait=False)
+atexit.register(AUX_POOL.shutdown, wait=False)
+
+# Element lists from list_ui_elements keyed on hwnd (None for the desktop).
+# An agent usually lists a window and then finds an element in it right
+# away; find_ui_element takes a match from a fresh list instead of walking
+# the same UIA tree again. Cleared whenever calibration changes.
+ELEMENT_CACHE_TTL_MS = 2000
+_ELEMENT_CACHE_SIZE = 32
+_ELEMENT_CACHE: dict[int | None, tuple[float, list[dict]]] = {}
+
+# UIA calls currently running, keyed on (function, args). An identical call
+# arriving meanwhile awaits the same job instead of walking the tree again.
+# Entries are removed when the job finishes, so results are never reused
+# after the fact — that is what _ELEMENT_CACHE is for.
+_INFLIGHT: dict[tuple, asyncio.Future] = {}
+
+_CACHE_TTL_SCHEMA = {
+    "type": "integer",
+    "minimum": 0,
+    "description": (
+        f"Reuse an element list fetched within this many ms (default {ELEMENT_CACHE_TTL_MS}). "
+        "0 forces a fresh UI Automation walk."
+    ),
+}
+
+# Agents often convert defensively without knowing whether the systems
+# differ; the same-system answer is a fixed shape, so it skips serialization.
+_IDENTITY_RESULT = '{"x":%d,"y":%d,"note":"Same system, no conversion needed"}'
+
 
 # ─── Tool Definitions ───────────────────────────────────────────────────────
 
-@server.list_tools()
-async def list_tools() -> list[Tool]:
-    return [
-        Tool(
-            name="calibrate",
-            description=(
-                "Calibrate DPI coordinate systems. Provide 2+ points with both "
-                "physical (Click-Tool/Move-Tool) and logical (Cursor.Position/GetWindowRect) "
-                "coordinates. Use MPos or similar tool to read coordinates at known landmarks. "
-                "Landmarks: Start button (bottom-left), Date/time (bottom-right), "
-                "Minimize button (upper-right)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "points": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "physical_x": {"type": "integer", "description": "X in physical coords (Click-Tool space)"},
-                                "physical_y": {"type": "integer", "description": "Y in physical coords (Click-Tool space)"},
-                                "logical_x": {"type": "integer", "description": "X in logical coords (Cursor.Position space)"},
-                                "logical_y": {"type": "integer", "description": "Y in logical coords (Cursor.Position space)"},
-                                "label": {"type": "string", "description": "Landmark name (e.g. 'start_button', 'datetime')"},
-                            },
-                            "required": ["physical_x", "physical_y", "logical_x", "logical_y"],
+# The tool list never changes, so it is built once at import.
+_TOOLS: list[Tool] = [
+    Tool(
+        name="calibrate",
+        description=(
+            "Calibrate DPI coordinate systems. Provide 2+ points with both "
+            "physical (Click-Tool/Move-Tool) and logical (Cursor.Position/GetWindowRect) "
+            "coordinates. Use MPos or similar tool to read coordinates at known landmarks. "
+            "Landmarks: Start button (bottom-left), Date/time (bottom-right), "
+            "Minimize button (upper-right)."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "points": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "physical_x": {"type": "integer", "description": "X in physical coords (Click-Tool space)"},
+                            "physical_y": {"type": "integer", "description": "Y in physical coords (Click-Tool space)"},
+                            "logical_x": {"type": "integer", "description": "X in logical coords (Cursor.Position space)"},
+                            "logical_y": {"type": "integer", "description": "Y in logical coords (Cursor.Position space)"},
+                            "label": {"type": "string", "description": "Landmark name (e.g. 'start_button', 'datetime')"},
                         },
-                        "minItems": 2,
-                        "description": "Calibration points with both coordinate systems",
+                        "required": ["physical_x", "physical_y", "logical_x", "logical_y"],
                     },
+                    "minItems": 2,
+                    "description": "Calibration points with both coordinate systems",
                 },
-                "required": ["points"],
             },
+            "required": ["points"],
+        },
+    ),
+    Tool(
+        name="calibrate_verify",
+        description=(
+            "Mark calibration as verified after Move-Tool confirmation. "
+            "Call this after using Move-Tool to go to a known landmark and "
+            "confirming the cursor landed correctly."
         ),
-        Tool(
-            name="calibrate_verify",
-            description=(
-                "Mark calibration as verified after Move-Tool confirmation. "
-                "Call this after using Move-Tool to go to a known landmark and "
-                "confirming the cursor landed correctly."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "success": {"type": "boolean", "description": "Did the cursor land on the expected landmark?"},
-                    "notes": {"type": "string", "description": "Optional verification notes"},
-                },
-                "required": ["success"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "success": {"type": "boolean", "description": "Did the cursor land on the expected landmark?"},
+                "notes": {"type": "string", "description": "Optional verification notes"},
             },
+            "required": ["success"],
+        },
+    ),
+    Tool(
+        name="get_calibration",
+        description="Get current calibration state (scale factors, verification status).",
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="convert_coordinates",
+        description=(
+            "Convert coordinates between physical and logical systems. "
+            "Physical = Click-Tool/Move-Tool/State-Tool space. "
+            "Logical = GetWindowRect/Cursor.Position/.NET space. "
+            "Pass x and y for one point, or points for many in one call."
         ),
-        Tool(
-            name="get_calibration",
-            description="Get current calibration state (scale factors, verification status).",
-            inputSchema={"type": "object", "properties": {}},
-        ),
-        Tool(
-            name="convert_coordinates",
-            description=(
-                "Convert coordinates between physical and logical systems. "
-                "Physical = Click-Tool/Move-Tool/State-Tool space. "
-                "Logical = GetWindowRect/Cursor.Position/.NET space."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "x": {"type": "integer", "description": "X coordinate"},
-                    "y": {"type": "integer", "description": "Y coordinate"},
-                    "from_system": {
-                        "type": "string",
-                        "enum": ["physical", "logical"],
-                        "description": "Source coordinate system",
-                    },
-                    "to_system": {
-                        "type": "string",
-                        "enum": ["physical", "logical"],
-                        "description": "Target coordinate system",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "x": {"type": "integer", "description": "X coordinate"},
+                "y": {"type": "integer", "description": "Y coordinate"},
+                "points": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "x": {"type": "integer"},
+                            "y": {"type": "integer"},
+                        },
+                        "required": ["x", "y"],
                     },
+                    "description": "Points to convert in one call (instead of x/y)",
                 },
-                "required": ["x", "y", "from_system", "to_system"],
-            },
-        ),
-        Tool(
-            name="find_ui_element",
-            description=(
-                "Find a UI element by name using Windows UI Automation. "
-                "Returns physical coordinates ready for Click-Tool/Move-Tool. "
-                "Works where State-Tool cannot see (Chrome extension popups, "
-                "overlay dialogs, native app controls)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "element_name": {"type": "string", "description": "Name of the UI element to find (exact match)"},
-                    "window_title": {"type": "string", "description": "Window title to scope search (substring match)"},
-                    "window_handle": {"type": "integer", "description": "Window handle (hwnd) — takes priority over title"},
+                "from_system": {
+                    "type": "string",
+                    "enum": ["physical", "logical"],
+                    "description": "Source coordinate system",
+                },
+                "to_system": {
+                    "type": "string",
+                    "enum": ["physical", "logical"],
+                    "description": "Target coordinate system",
                 },
-                "required": ["element_name"],
             },
+            "required": ["from_system", "to_system"],
+        },
+    ),
+    Tool(
+        name="find_ui_element",
+        description=(
+            "Find a UI element by name using Windows UI Automation. "
+            "Returns physical coordinates ready for Click-Tool/Move-Tool. "
+            "Works where State-Tool cannot see (Chrome extension popups, "
+            "overlay dialogs, native app controls)."
         ),
-        Tool(
-            name="find_all_ui_elements",
-            description=(
-                "Find ALL UI elements matching a name. Returns list of physical coordinates. "
-                "Useful when multiple elements share the same name (e.g. multiple 'Close' buttons)."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "element_name": {"type": "string", "description": "Name to search for"},
-                    "window_title": {"type": "string", "description": "Window title to scope search"},
-                    "window_handle": {"type": "integer", "description": "Window handle (hwnd)"},
-                },
-                "required": ["element_name"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "element_name": {"type": "string", "description": "Name of the UI element to find (exact match)"},
+                "window_title": {"type": "string", "description": "Window title to scope search (substring match)"},
+                "window_handle": {"type": "integer", "description": "Window handle (hwnd) — takes priority over title"},
+                "cache_ttl_ms": _CACHE_TTL_SCHEMA,
             },
+            "required": ["element_name"],
+        },
+    ),
+    Tool(
+        name="find_all_ui_elements",
+        description=(
+            "Find ALL UI elements matching a name. Returns list of physical coordinates. "
+            "Useful when multiple elements share the same name (e.g. multiple 'Close' buttons)."
         ),
-        Tool(
-            name="list_ui_elements",
-            description=(
-                "List all named interactive elements in a window (buttons, text fields, etc.). "
-                "Useful for discovering what's available before targeting a specific element."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "window_title": {"type": "string", "description": "Window title to scope search (substring match)"},
-                    "window_handle": {"type": "integer", "description": "Window handle (hwnd)"},
-                },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "element_name": {"type": "string", "description": "Name to search for"},
+                "window_title": {"type": "string", "description": "Window title to scope search"},
+                "window_handle": {"type": "integer", "description": "Window handle (hwnd)"},
             },
+            "required": ["element_name"],
+        },
+    ),
+    Tool(
+        name="list_ui_elements",
+        description=(
+            "List all named interactive elements in a window (buttons, text fields, etc.). "
+            "Useful for discovering what's available before targeting a specific element."
         ),
-        Tool(
-            name="find_window",
-            description="Find a window handle by title substring. Returns the hwnd for use with other tools.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string", "description": "Window title substring to search for"},
-                },
-                "required": ["title"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "window_title": {"type": "string", "description": "Window title to scope search (substring match)"},
+                "window_handle": {"type": "integer", "description": "Window handle (hwnd)"},
+                "cache_ttl_ms": _CACHE_TTL_SCHEMA,
+            },
+        },
+    ),
+    Tool(
+        name="find_window",
+        description="Find a window handle by title substring. Returns the hwnd for use with other tools.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "title": {"type": "string", "description": "Window title substring to search for"},
             },
+            "required": ["title"],
+        },
+    ),
+    Tool(
+        name="health_check",
+        description=(
+            "Run environment health checks: calibration freshness, "
+            "UI Automation availability, windows-mcp status. "
+            "Run at session start to ensure everything is working."
         ),
-        Tool(
-            name="health_check",
-            description=(
-                "Run environment health checks: calibration freshness, "
-                "UI Automation availability, windows-mcp status. "
-                "Run at session start to ensure everything is working."
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="patch_status",
+        description=(
+            "Check which windows-mcp patches are applied. "
+            "Returns list of patch intents and whether they're currently active. "
+            "If patches are missing, use Claude Code to apply them adaptively."
         ),
-        Tool(
-            name="patch_status",
-            description=(
-                "Check which windows-mcp patches are applied. "
-                "Returns list of patch intents and whether they're currently active. "
-                "If patches are missing, use Claude Code to apply them adaptively."
-            ),
-            inputSchema={"type": "object", "properties": {}},
+        inputSchema={"type": "object", "properties": {}},
+    ),
+    Tool(
+        name="batch_execute",
+        description=(
+            "Run several precision-desktop tool calls in one request. "
+            "Operations run concurrently (up to max_concurrent at a time) and "
+            "results come back in the same order as the operations."
         ),
-    ]
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {"type": "string", "description": "Tool name (e.g. 'find_ui_element')"},
+                            "arguments": {"type": "object", "description": "Arguments for that tool"},
+                        },
+                        "required": ["name"],
+                    },
+                    "minItems": 1,
+                    "description": "Tool calls to run",
+                },
+                "max_concurrent": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "description": "Maximum operations in flight at once (default 5)",
+                },
+                "stop_on_error": {
+                    "type": "boolean",
+                    "description": "Skip operations not yet started once one fails (default false)",
+                },
+            },
+            "required": ["operations"],
+        },
+    ),
+]
+
+
+# Failures are returned as {"ok": false, "error_code", "error_type", "error"}
+# so agents can branch on error_code instead of parsing the message. UIA
+# HResults map to their own codes; otherwise the exception type decides.
+_ERR_CODES_BY_HRESULT = {
+    -2147220991: "uia_element_not_available",  # UIA_E_ELEMENTNOTAVAILABLE
+    -2147220992: "uia_element_not_enabled",    # UIA_E_ELEMENTNOTENABLED
+    -2146233083: "uia_timeout",                # UIA_E_TIMEOUT
+}
+_ERR_CODES_BY_TYPE = {
+    "TimeoutExpired": "timeout",
+    "ValueError": "invalid_value",
+    "PowerShellError": "powershell_error",
+    "PowerShellUnavailableError": "powershell_unavailable",
+}
+_ERR_MESSAGE_LIMIT = 4096
+
+
+def _error(error_code: str, error_type: str, message: str) -> dict:
+    """Build a failure payload, capping the message length."""
+    return {
+        "ok": False,
+        "error_code": error_code,
+        "error_type": error_type,
+        "error": message[:_ERR_MESSAGE_LIMIT],
+    }
+
+
+def _exception_error(e: Exception) -> dict:
+    """Build the failure payload for an exception raised by a tool handler."""
+    type_name = type(e).__name__
+    code = (
+        _ERR_CODES_BY_HRESULT.get(getattr(e, "hresult", None))
+        or _ERR_CODES_BY_TYPE.get(type_name, "internal")
+    )
+    return _error(code, getattr(e, "exception_type", "") or type_name, str(e))
+
+
+def _build_validators() -> dict:
+    """
+    Compile one validator per tool, for the newest draft the installed
+    jsonschema supports. Too old a jsonschema means no validation rather
+    than a server that fails to start.
+    """
+    if jsonschema is None:
+        return {}
+    try:
+        return {
+            t.name: jsonschema.validators.validator_for(t.inputSchema)(t.inputSchema)
+            for t in _TOOLS
+        }
+    except AttributeError:
+        return {}
+
+
+# Validators are compiled once per tool rather than per call.
+_VALIDATORS = _build_validators()
+
+
+def _invalid_args(name: str, arguments: dict) -> dict | None:
+    """Return an invalid_args error payload, or None if the arguments are valid."""
+    validator = _VALIDATORS.get(name)
+    if validator is None:
+        return None
+    error = jsonschema.exceptions.best_match(validator.iter_errors(arguments))
+    if error is None:
+        return None
+    path = ".".join(str(p) for p in error.absolute_path)
+    return _error(
+        "invalid_args", "ValidationError", f"{path}: {error.message}" if path else error.message
+    )
+
+
+@server.list_tools()
+async def list_tools() -> list[Tool]:
+    return _TOOLS
 
 
 # ─── Tool Handlers ───────────────────────────────────────────────────────────
 
-@server.call_tool()
-async def call_tool(name: str, arguments: dict) -> list[TextContent]:
-    try:
-        if name == "calibrate":
-            points = arguments["points"]
-            state = calibration.compute_calibration(points)
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "status": "calibrated",
-                    "scale_x": state["scale_x"],
-                    "scale_y": state["scale_y"],
-                    "offset_x": state["offset_x"],
-                    "offset_y": state["offset_y"],
-                    "consistent": state["consistent"],
-                    "spread_x": state.get("spread_x"),
-                    "spread_y": state.get("spread_y"),
-                    "points_used": len(points),
-                    "next_step": (
-                        "Calibration computed. To verify: use Move-Tool to go to a known "
-                        "landmark (e.g. minimize button of a window), confirm the cursor "
-                        "landed correctly, then call 'calibrate_verify' with the result."
-                    ),
-                }, indent=2),
-            )]
-
-        elif name == "calibrate_verify":
-            success = arguments["success"]
-            notes = arguments.get("notes", "")
-            state = calibration.mark_verified(success, notes)
-            status = "verified" if success else "failed"
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "status": status,
-                    "message": f"Calibration {status}." + (f" Notes: {notes}" if notes else ""),
-                    "scale_x": state["scale_x"],
-                    "scale_y": state["scale_y"],
-                }, indent=2),
-            )]
-
-        elif name == "get_calibration":
-            state = calibration.load_state()
-            return [TextContent(type="text", text=json.dumps(state, indent=2))]
-
-        elif name == "convert_coordinates":
-            x, y = arguments["x"], arguments["y"]
-            from_sys = arguments["from_system"]
-            to_sys = arguments["to_system"]
-
-            if from_sys == to_sys:
-                result = {"x": x, "y": y, "note": "Same system, no conversion needed"}
-            elif from_sys == "physical" and to_sys == "logical":
-                lx, ly = calibration.physical_to_logical(x, y)
-                result = {"physical_x": x, "physical_y": y, "logical_x": lx, "logical_y": ly}
-            else:
-                px, py = calibration.logical_to_physical(x, y)
-                result = {"logical_x": x, "logical_y": y, "physical_x": px, "physical_y": py}
-
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        elif name == "find_ui_element":
-            element_name = arguments["element_name"]
-            window_title = arguments.get("window_title")
-            window_handle = arguments.get("window_handle")
-
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: find_element.find_element_by_name(
-                    element_name, window_title, window_handle
-                ),
-            )
-
-            if result:
-                result["note"] = "Coordinates are PHYSICAL — use directly with Click-Tool/Move-Tool"
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
-            else:
-                return [TextContent(
-                    type="text",
-                    text=json.dumps({
-                        "found": False,
-                        "element_name": element_name,
-                        "window_title": window_title,
-                        "suggestion": "Try list_ui_elements to see what's available in this window.",
-                    }, indent=2),
-                )]
-
-        elif name == "find_all_ui_elements":
-            element_name = arguments["element_name"]
-            window_title = arguments.get("window_title")
-            window_handle = arguments.get("window_handle")
-
-            results = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: find_element.find_elements_by_name(
-                    element_name, window_title, window_handle
-                ),
-            )
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "count": len(results),
-                    "elements": results,
-                    "note": "All coordinates are PHYSICAL" if results else "No elements found",
-                }, indent=2),
-            )]
-
-        elif name == "list_ui_elements":
-            window_title = arguments.get("window_title")
-            window_handle = arguments.get("window_handle")
-
-            results = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: find_element.list_window_elements(
-                    window_title, window_handle
-                ),
-            )
-
-            return [TextContent(
-                type="text",
-                text=json.dumps({
-                    "count": len(results),
-                    "elements": results,
-                    "note": "All coordinates are PHYSICAL" if results else "No interactive elements found",
-                }, indent=2),
-            )]
-
-        elif name == "find_window":
-            title = arguments["title"]
-            hwnd = await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: find_element.find_window_handle(title),
-            )
-
-            if hwnd:
-                return [TextContent(
-                    type="text",
-                    text=json.dumps({"found": True, "hwnd": hwnd, "title_searched": title}, indent=2),
-                )]
-            else:
-                return [TextContent(
-                    type="text",
-                    text=json.dumps({"found": False, "title_searched": title}, indent=2),
-                )]
-
-        elif name == "health_check":
-            checks = await asyncio.get_event_loop().run_in_executor(
-                None, health_check.run_all_checks
-            )
-            return [TextContent(type="text", text=json.dumps(checks, indent=2))]
-
-        elif name == "patch_status":
-            status = await asyncio.get_event_loop().run_in_executor(
-                None, patches.get_patch_status
-            )
-            return [TextContent(type="text", text=json.dumps(status, indent=2))]
+async def _run_uia(func, *args):
+    """Run func(*args) on UIA_POOL, joining an identical call already in flight."""
+    key = (func, args)
+    future = _INFLIGHT.get(key)
+    if future is None:
+        future = asyncio.get_running_loop().run_in_executor(UIA_POOL, func, *args)
+        _INFLIGHT[key] = future
+        future.add_done_callback(lambda _: _INFLIGHT.pop(key, None))
+    # Shielded so one caller giving up doesn't cancel the others' result.
+    return await asyncio.shield(future)
+
+
+async def _resolve_hwnd(window_title: str | None, window_handle: int | None) -> int | None:
+    """
+    Resolve a window title to its hwnd once per call (an explicit handle wins).
+    find_element caches the lookup, so find_window, list_ui_elements and the
+    find tools share one resolution per window.
+    """
+    if window_handle or not window_title:
+        return window_handle
+    return await _run_uia(find_element.resolve_window, window_title)
+
+
+def _cached_elements(hwnd: int | None, ttl_ms: int) -> list[dict] | None:
+    """Return the cached element list for a window if younger than ttl_ms."""
+    entry = _ELEMENT_CACHE.get(hwnd)
+    if entry is None or ttl_ms <= 0:
+        return None
+    fetched_at, elements = entry
+    if (time.monotonic() - fetched_at) * 1000 > ttl_ms:
+        return None
+    return elements
+
+
+async def _window_elements(
+    window_title: str | None, window_handle: int | None, hwnd: int | None, ttl_ms: int
+) -> list[dict]:
+    """List a window's elements, reusing a fresh cached walk when there is one."""
+    elements = _cached_elements(hwnd, ttl_ms)
+    if elements is None:
+        elements = await _run_uia(find_element.list_window_elements, window_title, window_handle)
+        if len(_ELEMENT_CACHE) >= _ELEMENT_CACHE_SIZE:
+            _ELEMENT_CACHE.pop(next(iter(_ELEMENT_CACHE)))
+        _ELEMENT_CACHE[hwnd] = (time.monotonic(), elements)
+    return elements
+
+
+async def _h_calibrate(arguments: dict) -> dict:
+    points = arguments["points"]
+    state = calibration.compute_calibration(points)
+    _ELEMENT_CACHE.clear()
+    return {
+        "status": "calibrated",
+        "scale_x": state["scale_x"],
+        "scale_y": state["scale_y"],
+        "offset_x": state["offset_x"],
+        "offset_y": state["offset_y"],
+        "consistent": state["consistent"],
+        "spread_x": state.get("spread_x"),
+        "spread_y": state.get("spread_y"),
+        "points_used": len(points),
+        "next_step": (
+            "Calibration computed. To verify: use Move-Tool to go to a known "
+            "landmark (e.g. minimize button of a window), confirm the cursor "
+            "landed correctly, then call 'calibrate_verify' with the result."
+        ),
+    }
 
-        else:
-            return [TextContent(type="text", text=f"Unknown tool: {name}")]
 
+async def _h_calibrate_verify(arguments: dict) -> dict:
+    success = arguments["success"]
+    notes = arguments.get("notes", "")
+    state = calibration.mark_verified(success, notes)
+    _ELEMENT_CACHE.clear()
+    status = "verified" if success else "failed"
+    return {
+        "status": status,
+        "message": f"Calibration {status}." + (f" Notes: {notes}" if notes else ""),
+        "scale_x": state["scale_x"],
+        "scale_y": state["scale_y"],
+    }
+
+
+async def _h_get_calibration(arguments: dict) -> dict:
+    return calibration.load_state()
+
+
+async def _h_convert_coordinates(arguments: dict) -> dict | str:
+    from_sys = arguments["from_system"]
+    to_sys = arguments["to_system"]
+
+    if "points" in arguments:
+        points = [(p["x"], p["y"]) for p in arguments["points"]]
+        if from_sys == to_sys:
+            converted = points
+        elif from_sys == "physical" and to_sys == "logical":
+            converted = calibration.physical_to_logical_batch(points)
+        else:
+            converted = calibration.logical_to_physical_batch(points)
+        return {
+            "from_system": from_sys,
+            "to_system": to_sys,
+            "count": len(converted),
+            "points": [{"x": cx, "y": cy} for cx, cy in converted],
+        }
+
+    if "x" not in arguments or "y" not in arguments:
+        raise ValueError("Provide x and y, or points")
+    x, y = arguments["x"], arguments["y"]
+
+    if from_sys == to_sys:
+        # The template only fits ints; without schema validation anything
+        # else is echoed back as given.
+        if type(x) is int and type(y) is int:
+            return _IDENTITY_RESULT % (x, y)
+        return {"x": x, "y": y, "note": "Same system, no conversion needed"}
+    if from_sys == "physical" and to_sys == "logical":
+        lx, ly = calibration.physical_to_logical(x, y)
+        return {"physical_x": x, "physical_y": y, "logical_x": lx, "logical_y": ly}
+    px, py = calibration.logical_to_physical(x, y)
+    return {"logical_x": x, "logical_y": y, "physical_x": px, "physical_y": py}
+
+
+async def _h_find_ui_element(arguments: dict) -> dict:
+    element_name = arguments["element_name"]
+    window_title = arguments.get("window_title")
+    window_handle = arguments.get("window_handle")
+    ttl_ms = arguments.get("cache_ttl_ms", ELEMENT_CACHE_TTL_MS)
+
+    hwnd = await _resolve_hwnd(window_title, window_handle)
+    cached = _cached_elements(hwnd, ttl_ms) or []
+    result = next((dict(e) for e in cached if e["name"] == element_name), None)
+    if result is None and not (window_title and hwnd is None):
+        result = await _run_uia(
+            find_element.find_element_by_name, element_name, window_title, window_handle
+        )
+
+    if result:
+        # A copy: a coalesced result is shared with other callers.
+        return {**result, "note": "Coordinates are PHYSICAL — use directly with Click-Tool/Move-Tool"}
+    return {
+        "found": False,
+        "element_name": element_name,
+        "window_title": window_title,
+        "suggestion": "Try list_ui_elements to see what's available in this window.",
+    }
+
+
+async def _h_find_all_ui_elements(arguments: dict) -> dict:
+    element_name = arguments["element_name"]
+    window_title = arguments.get("window_title")
+    window_handle = arguments.get("window_handle")
+
+    # Not answered from the list_ui_elements cache: that list holds only
+    # named, visible interactive elements and stops at 100, so it can't
+    # stand in for a search that must return every match.
+    results = await _run_uia(
+        find_element.find_elements_by_name, element_name, window_title, window_handle
+    )
+
+    return {
+        "count": len(results),
+        "elements": results,
+        "note": "All coordinates are PHYSICAL" if results else "No elements found",
+    }
+
+
+async def _h_list_ui_elements(arguments: dict) -> dict:
+    window_title = arguments.get("window_title")
+    window_handle = arguments.get("window_handle")
+    ttl_ms = arguments.get("cache_ttl_ms", ELEMENT_CACHE_TTL_MS)
+
+    hwnd = await _resolve_hwnd(window_title, window_handle)
+    if window_title and hwnd is None:
+        results = []
+    else:
+        results = await _window_elements(window_title, window_handle, hwnd, ttl_ms)
+
+    return {
+        "count": len(results),
+        "elements": results,
+        "note": "All coordinates are PHYSICAL" if results else "No interactive elements found",
+    }
+
+
+async def _h_find_window(arguments: dict) -> dict:
+    title = arguments["title"]
+    hwnd = await _run_uia(find_element.resolve_window, title)
+
+    if hwnd:
+        return {"found": True, "hwnd": hwnd, "title_searched": title}
+    return {"found": False, "title_searched": title}
+
+
+async def _h_health_check(arguments: dict) -> dict:
+    # The checks are independent, so total time is the slowest probe.
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(loop.run_in_executor(AUX_POOL, check)
+          for check in health_check.CHECKS.values()),
+        return_exceptions=True,
+    )
+    checks = {
+        check_name: (
+            {"status": "error", "message": str(result)}
+            if isinstance(result, Exception) else result
+        )
+        for check_name, result in zip(health_check.CHECKS, results)
+    }
+    return health_check.summarize(checks)
+
+
+async def _h_patch_status(arguments: dict) -> dict:
+    return await asyncio.get_running_loop().run_in_executor(
+        AUX_POOL, patches.get_patch_status
+    )
+
+
+async def _h_batch_execute(arguments: dict) -> dict:
+    operations = arguments["operations"]
+    stop_on_error = arguments.get("stop_on_error", False)
+    max_concurrent = arguments.get("max_concurrent", 5)
+    # Checked here too: without jsonschema a 0 would leave the batch waiting
+    # on the semaphore forever.
+    if type(max_concurrent) is not int or max_concurrent < 1:
+        return _error("invalid_args", "ValueError", "max_concurrent must be an integer >= 1")
+    semaphore = asyncio.Semaphore(max_concurrent)
+    stopped = asyncio.Event()
+
+    async def run_one(op: dict) -> dict:
+        op_name = op["name"]
+        async with semaphore:
+            if stopped.is_set():
+                return {"name": op_name, "ok": False, "skipped": True,
+                        "error_code": "skipped",
+                        "error": "Skipped after an earlier operation failed"}
+            if op_name == "batch_execute":
+                result = _error("invalid_args", "ValueError", "batch_execute cannot be nested")
+            else:
+                result = await _dispatch(op_name, op.get("arguments") or {})
+
+        if isinstance(result, str):
+            result = json.loads(result)
+        if isinstance(result, dict) and result.get("ok") is False:
+            if stop_on_error:
+                stopped.set()
+            return {"name": op_name, **result}
+        return {"name": op_name, "ok": True, "result": result}
+
+    results = await asyncio.gather(*(run_one(op) for op in operations))
+    return {
+        "count": len(results),
+        "ok": all(r["ok"] for r in results),
+        "results": results,
+    }
+
+
+# Each handler returns its result payload: a dict to be serialized, or a
+# string that is already JSON. batch_execute runs handlers directly, so
+# results are serialized once for the whole batch.
+_HANDLERS = {
+    "calibrate": _h_calibrate,
+    "calibrate_verify": _h_calibrate_verify,
+    "get_calibration": _h_get_calibration,
+    "convert_coordinates": _h_convert_coordinates,
+    "find_ui_element": _h_find_ui_element,
+    "find_all_ui_elements": _h_find_all_ui_elements,
+    "list_ui_elements": _h_list_ui_elements,
+    "find_window": _h_find_window,
+    "health_check": _h_health_check,
+    "patch_status": _h_patch_status,
+    "batch_execute": _h_batch_execute,
+}
+
+
+async def _dispatch(name: str, arguments: dict) -> dict | str:
+    """Validate and run one tool call. Failures come back as error payloads."""
+    invalid = _invalid_args(name, arguments)
+    if invalid is not None:
+        return invalid
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        return _error("unknown_tool", "", f"Unknown tool: {name}")
+    try:
+        return await handler(arguments)
     except Exception as e:
-        return [TextContent(type="text", text=f"Error: {type(e).__name__}: {e}")]
+        return _exception_error(e)
+
+
+@server.call_tool()
+async def call_tool(name: str, arguments: dict) -> list[TextContent]:
+    result = await _dispatch(name, arguments)
+    return [TextContent(
+        type="text",
+        text=result if isinstance(result, str) else _dumps(result),
+    )]
 
 
 # ─── Main ────────────────────────────────────────────────────────────────────
 
 async def main():
     async with stdio_server() as (read_stream, write_stream):
+        # Not awaited: the host warms up while the client initializes.
+        asyncio.get_running_loop().run_in_executor(UIA_POOL, find_element.warm_up)
         await server.run(read_stream, write_stream, server.create_initialization_options())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # winloop/uvloop (from the speedups extra) run the stdio loop on libuv.
+    run = asyncio.run
+    try:
+        if sys.platform == "win32":
+            import winloop as fast_loop
+        else:
+            import uvloop as fast_loop
+        run = fast_loop.run
+    except ImportError:
+        pass
+    run(main())